@@ -0,0 +1,167 @@
+"""Virtual clusters with attributes computed from another cluster.
+
+A derived cluster declares its attributes as transforms of attributes on a
+source cluster of the same endpoint. It subscribes to the source cluster
+events itself, computes values on read from the source cluster and never
+writes derived values to its in-memory attribute cache at runtime.
+
+This does not reduce events: a source update still produces the source event
+plus one derived event. zigpy persists the derived event to its database like
+any other attribute update, so after a restart the last derived value is
+loaded back into the derived cluster cache, where reads ignore it.
+
+The module name starts with an underscore, so ZHA loads it before the quirk
+modules that import it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any, NamedTuple
+
+from zhaquirks import LocalDataCluster
+from zigpy.zcl import (
+    AttributeClearedEvent,
+    AttributeReadEvent,
+    AttributeReportedEvent,
+    AttributeUpdatedEvent,
+    AttributeWrittenEvent,
+    foundation,
+)
+
+SOURCE_EVENTS = (
+    AttributeClearedEvent,
+    AttributeReadEvent,
+    AttributeReportedEvent,
+    AttributeUpdatedEvent,
+    AttributeWrittenEvent,
+)
+
+
+class DerivedAttribute(NamedTuple):
+    """Contains a derived attribute definition."""
+
+    source_cluster: str
+    source_attribute: int
+    transform: Callable[[Any], Any]
+
+
+class DerivedCluster(LocalDataCluster):
+    """Local cluster which computes attributes from a source cluster."""
+
+    derived_attributes: dict[int, DerivedAttribute] = {}
+
+    def __init__(self, *args, **kwargs):
+        """Initialize a new derived cluster."""
+        super().__init__(*args, **kwargs)
+        self._subscribed_sources: set[str] = set()
+        self._subscribe_sources()
+
+    def _subscribe_sources(self) -> None:
+        """Subscribe to events of source clusters present on the endpoint.
+
+        Called again on every read, so the source cluster may be added to the
+        endpoint after the derived cluster.
+        """
+        for derived in self.derived_attributes.values():
+            if derived.source_cluster in self._subscribed_sources:
+                continue
+
+            source = getattr(self.endpoint, derived.source_cluster, None)
+            if source is None:
+                continue
+
+            callback = partial(self._source_event, derived.source_cluster)
+            for event in SOURCE_EVENTS:
+                source.on_event(event.event_type, callback)
+
+            self._subscribed_sources.add(derived.source_cluster)
+
+    def _compute(self, attrid: int) -> Any:
+        """Compute derived attribute value from the source cluster."""
+        derived = self.derived_attributes[attrid]
+        source = getattr(self.endpoint, derived.source_cluster)
+        value = source.get(derived.source_attribute)
+        return None if value is None else derived.transform(value)
+
+    def get(self, key: int | str, default: Any = None) -> Any:
+        """Get derived attribute value or fall back to the attribute cache."""
+        self._subscribe_sources()
+        attrid = self.find_attribute(key).id
+        if attrid not in self.derived_attributes:
+            return super().get(key, default)
+
+        value = self._compute(attrid)
+        return default if value is None else value
+
+    async def read_attributes(self, attributes, *args, **kwargs):
+        """Override read_attributes method to compute derived attributes."""
+        self._subscribe_sources()
+        success, failure = {}, {}
+        remaining = []
+        for attribute in attributes:
+            attrid = self.find_attribute(attribute).id
+            if attrid not in self.derived_attributes:
+                remaining.append(attribute)
+            elif (value := self._compute(attrid)) is None:
+                failure[attribute] = foundation.Status.UNSUPPORTED_ATTRIBUTE
+            else:
+                success[attribute] = value
+
+        if remaining:
+            remaining_success, remaining_failure = await super().read_attributes(
+                remaining, *args, **kwargs
+            )
+            success.update(remaining_success)
+            failure.update(remaining_failure)
+
+        return success, failure
+
+    def _source_event(self, source_cluster: str, event: Any) -> None:
+        """Emit derived attribute events for a source attribute event."""
+        if getattr(event, "status", foundation.Status.SUCCESS) != (
+            foundation.Status.SUCCESS
+        ):
+            return
+
+        value = getattr(event, "value", None)
+        for derived_attrid, derived in self.derived_attributes.items():
+            if (
+                derived.source_cluster == source_cluster
+                and derived.source_attribute == event.attribute_id
+            ):
+                self._emit_attribute_updated(
+                    self.find_attribute(derived_attrid),
+                    None if value is None else derived.transform(value),
+                )
+
+    def _emit_attribute_updated(
+        self, attr_def: foundation.ZCLAttributeDef, value: Any
+    ) -> None:
+        """Emit attribute events without writing to the attribute cache."""
+        # Mirrors the events emitted by Cluster._update_attribute in zigpy 0.92.
+        # Event suppression and manufacturer code context are not applied, as
+        # derived attributes are never reported by the device directly.
+        common = {
+            "device_ieee": str(self.endpoint.device.ieee),
+            "endpoint_id": self.endpoint.endpoint_id,
+            "cluster_type": self._type,
+            "cluster_id": self.cluster_id,
+            "attribute_name": attr_def.name,
+            "attribute_id": attr_def.id,
+            "manufacturer_code": self._get_effective_manufacturer_code(attr_def),
+        }
+
+        if value is None:
+            self.emit(AttributeClearedEvent.event_type, AttributeClearedEvent(**common))
+            return
+
+        self.emit(
+            AttributeUpdatedEvent.event_type,
+            AttributeUpdatedEvent(**common, value=value),
+        )
+
+        # Legacy `listener_event`, still used by older listeners
+        self.listener_event("attribute_updated", attr_def.id, value, datetime.now(UTC))
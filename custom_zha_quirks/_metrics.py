@@ -0,0 +1,205 @@
+"""Opt-in hot-path metrics for custom quirk clusters.
+
+Metrics are disabled by default and every recording call returns
+immediately in that case. Enable them by setting the
+``CUSTOM_ZHA_QUIRKS_METRICS`` environment variable or by calling
+``METRICS.enable()``. While enabled, the Prometheus text dump is logged at
+INFO level every ``CUSTOM_ZHA_QUIRKS_METRICS_LOG_INTERVAL`` seconds
+(300 by default, 0 to turn off) and on demand via ``METRICS.log()``.
+
+The module name starts with an underscore, so ZHA loads it before the quirk
+modules that import it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import logging
+import os
+import time
+from typing import Final
+
+_LOGGER = logging.getLogger(__name__)
+
+PREFIX: Final = "custom_zha_quirks"
+
+DEFAULT_LOG_INTERVAL: Final = 300.0
+
+DEFAULT_BUCKETS: Final = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, object]) -> Labels:
+    """Get hashable labels key."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    """Format labels for the Prometheus text format."""
+    if extra is not None:
+        labels = (*labels, extra)
+
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+class Histogram:
+    """Latency histogram with fixed buckets."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize a new histogram."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Get cumulative bucket counts keyed by upper bound."""
+        result = []
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            result.append((str(bound), total))
+
+        return result
+
+
+class Metrics:
+    """Registry of counters and latency histograms."""
+
+    def __init__(
+        self, enabled: bool = False, log_interval: float = DEFAULT_LOG_INTERVAL
+    ) -> None:
+        """Initialize a new metrics registry."""
+        self.enabled = enabled
+        self.log_interval = log_interval
+        self._next_log = time.monotonic() + log_interval
+        self._counters: dict[str, dict[Labels, int]] = {}
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def enable(self) -> None:
+        """Enable metrics collection."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable metrics collection."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Drop all collected metrics."""
+        self._counters.clear()
+        self._histograms.clear()
+
+    def log(self) -> None:
+        """Log collected metrics in the Prometheus text exposition format."""
+        _LOGGER.info("Custom quirk metrics:\n%s", self.to_prometheus())
+
+    def _maybe_log(self) -> None:
+        """Log collected metrics if the log interval has elapsed."""
+        if self.log_interval > 0 and (now := time.monotonic()) >= self._next_log:
+            self._next_log = now + self.log_interval
+            self.log()
+
+    def start(self) -> float | None:
+        """Get start time for a latency measurement."""
+        return time.perf_counter() if self.enabled else None
+
+    def inc(self, name: str, value: int = 1, **labels: object) -> None:
+        """Increment a counter."""
+        if not self.enabled:
+            return
+
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + value
+        self._maybe_log()
+
+    def observe(self, name: str, start: float | None, **labels: object) -> None:
+        """Record time elapsed since start in a latency histogram."""
+        if start is None or not self.enabled:
+            return
+
+        elapsed = time.perf_counter() - start
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        if (histogram := series.get(key)) is None:
+            histogram = series[key] = Histogram()
+
+        histogram.observe(elapsed)
+        self._maybe_log()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Get a JSON-serializable copy of collected metrics."""
+        return {
+            "counters": {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in series.items()
+                ]
+                for name, series in self._counters.items()
+            },
+            "histograms": {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "buckets": dict(histogram.cumulative()),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                    }
+                    for key, histogram in series.items()
+                ]
+                for name, series in self._histograms.items()
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Get collected metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, series in sorted(self._counters.items()):
+            metric = f"{PREFIX}_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for key, value in series.items():
+                lines.append(f"{metric}{_format_labels(key)} {value}")
+
+        for name, series in sorted(self._histograms.items()):
+            metric = f"{PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for key, histogram in series.items():
+                for bound, count in histogram.cumulative():
+                    labels = _format_labels(key, ("le", bound))
+                    lines.append(f"{metric}_bucket{labels} {count}")
+
+                lines.append(f"{metric}_sum{_format_labels(key)} {histogram.sum}")
+                lines.append(f"{metric}_count{_format_labels(key)} {histogram.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+METRICS: Final = Metrics(
+    enabled=bool(os.environ.get("CUSTOM_ZHA_QUIRKS_METRICS")),
+    log_interval=float(
+        os.environ.get("CUSTOM_ZHA_QUIRKS_METRICS_LOG_INTERVAL", DEFAULT_LOG_INTERVAL)
+    ),
+)
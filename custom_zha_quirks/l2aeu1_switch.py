@@ -14,7 +14,27 @@ from zhaquirks.xiaomi.aqara.opple_switch import (
     OppleSwitchCluster,
     XiaomiOpple2ButtonSwitchBase,
 )
-from zhaquirks.xiaomi.aqara.opple_remote import MultistateInputCluster
+from zhaquirks.xiaomi.aqara.opple_remote import (
+    STATUS_TYPE_ATTR,
+    MultistateInputCluster as OppleMultistateInputCluster,
+)
+
+from _metrics import METRICS
+
+
+class MultistateInputCluster(OppleMultistateInputCluster):
+    """Opple multistate input cluster with decoded event metrics."""
+
+    def _update_attribute(self, attrid, value):
+        start = METRICS.start()
+        super()._update_attribute(attrid, value)
+
+        if attrid == STATUS_TYPE_ATTR:
+            METRICS.inc("l2aeu1_events_decoded", endpoint=self.endpoint.endpoint_id)
+            METRICS.observe(
+                "l2aeu1_event_decode", start, endpoint=self.endpoint.endpoint_id
+            )
+
 
 (
     QuirkBuilder(LUMI, "lumi.switch.l2aeu1")
@@ -11,7 +11,6 @@ from zhaquirks.const import (
     OUTPUT_CLUSTERS,
     PROFILE_ID,
 )
-from zhaquirks import LocalDataCluster
 from zigpy.profiles import zha
 from zigpy.quirks import CustomDevice, CustomCluster
 from zigpy.zcl.clusters.general import (
@@ -25,6 +24,9 @@ from zigpy.zcl.clusters.general import (
 )
 from zigpy.zcl.clusters.measurement import TemperatureMeasurement
 
+from _derived import DerivedAttribute, DerivedCluster
+from _metrics import METRICS
+
 PTVO: Final = "PTVO"
 
 PRESENT_VALUE: Final = 0x0055
@@ -41,17 +43,27 @@ class AnalogInputCluster(CustomCluster, AnalogInput):
     """PTVO device temperature analog input cluster."""
 
     def _update_attribute(self, attrid, value):
+        start = METRICS.start()
         super()._update_attribute(attrid, value)
+        METRICS.inc("ptvo_analog_input_updates")
+
+        if attrid == PRESENT_VALUE and value is not None:
+            METRICS.inc("ptvo_analog_input_forwarded_values")
 
-        if attrid == PRESENT_VALUE:
-            self.endpoint.device_temperature.update_attribute(
-                CURRENT_TEMPERATURE, value * 100
-            )
+        METRICS.observe("ptvo_analog_input_update", start)
 
 
-class DeviceTemperatureCluster(LocalDataCluster, DeviceTemperature):
+class DeviceTemperatureCluster(DerivedCluster, DeviceTemperature):
     """PTVO device temperature cluster."""
 
+    derived_attributes = {
+        CURRENT_TEMPERATURE: DerivedAttribute(
+            source_cluster=AnalogInput.ep_attribute,
+            source_attribute=PRESENT_VALUE,
+            transform=lambda value: value * 100,
+        ),
+    }
+
 
 class PtvoZbminiLightV1(CustomDevice):
     """PTVO ZBMINI light version 1."""
@@ -27,6 +27,8 @@ from zhaquirks.const import (
 from zhaquirks.tuya import TuyaManufCluster
 from zhaquirks import CustomCluster
 
+from _metrics import METRICS
+
 
 class TuyaLevelControl(CustomCluster, LevelControl):
     """Custom LevelControl cluster to fix level update and on/off."""
@@ -50,52 +52,58 @@ class TuyaLevelControl(CustomCluster, LevelControl):
         **kwargs: Any,
     ):
         """Override command method to update current_level on move_to_level(_with_on_off)."""
-        if kwargs and "level" in kwargs:
-            level = kwargs["level"]
-        elif args:
-            level = args[0]
-        else:
-            level = 0
+        start = METRICS.start()
+        METRICS.inc("tuya_level_control_commands", command_id=command_id)
+        try:
+            if kwargs and "level" in kwargs:
+                level = kwargs["level"]
+            elif args:
+                level = args[0]
+            else:
+                level = 0
 
-        on_off = bool(level)
+            on_off = bool(level)
 
-        if (
-            command_id == self.commands_by_name["move_to_level_with_on_off"].id
-            and self.endpoint.on_off.get("on_off") != on_off
-        ):
-            self.create_catching_task(
-                self.endpoint.on_off.command(
-                    command_id=self.on_off_command_id(on_off),
-                    manufacturer=manufacturer,
-                    expect_reply=False,
+            if (
+                command_id == self.commands_by_name["move_to_level_with_on_off"].id
+                and self.endpoint.on_off.get("on_off") != on_off
+            ):
+                self.create_catching_task(
+                    self.endpoint.on_off.command(
+                        command_id=self.on_off_command_id(on_off),
+                        manufacturer=manufacturer,
+                        expect_reply=False,
+                    )
                 )
-            )
+                METRICS.inc("tuya_level_control_tasks")
+
+            if (
+                command_id == self.commands_by_name["move_to_level_with_on_off"].id
+                and not on_off
+            ):
+                return foundation.GENERAL_COMMANDS[
+                    foundation.GeneralCommand.Default_Response
+                ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
 
-        if (
-            command_id == self.commands_by_name["move_to_level_with_on_off"].id
-            and not on_off
-        ):
-            return foundation.GENERAL_COMMANDS[
-                foundation.GeneralCommand.Default_Response
-            ].schema(command_id=command_id, status=foundation.Status.SUCCESS)
+            if command_id in (
+                self.commands_by_name["move_to_level"].id,
+                self.commands_by_name["move_to_level_with_on_off"].id,
+            ):
+                await self.write_attributes(
+                    {self.attributes_by_name["current_level"].id: level},
+                    manufacturer=manufacturer,
+                )
 
-        if command_id in (
-            self.commands_by_name["move_to_level"].id,
-            self.commands_by_name["move_to_level_with_on_off"].id,
-        ):
-            await self.write_attributes(
-                {self.attributes_by_name["current_level"].id: level},
+            return await super().command(
+                command_id,
+                *args,
                 manufacturer=manufacturer,
+                expect_reply=expect_reply,
+                tsn=tsn,
+                **kwargs,
             )
-
-        return await super().command(
-            command_id,
-            *args,
-            manufacturer=manufacturer,
-            expect_reply=expect_reply,
-            tsn=tsn,
-            **kwargs,
-        )
+        finally:
+            METRICS.observe("tuya_level_control_command", start, command_id=command_id)
 
 
 class DimmerModule0_10V(CustomDevice):
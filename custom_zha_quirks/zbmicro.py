@@ -5,6 +5,8 @@ from zigpy.quirks.v2 import QuirkBuilder
 import zigpy.types as t
 from zigpy.zcl.foundation import BaseAttributeDefs, ZCLAttributeDef
 
+from _metrics import METRICS
+
 SHENZHEN_COOLKIT_TECHNOLOGY_CO_LTD_MANUFACTURER_ID = 0x1286
 
 
@@ -24,6 +26,17 @@ class SonoffCluster(CustomCluster):
             is_manufacturer_specific=True,
         )
 
+    async def write_attributes(self, attributes, *args, **kwargs):
+        """Override write_attributes method to record attribute writes."""
+        start = METRICS.start()
+        try:
+            result = await super().write_attributes(attributes, *args, **kwargs)
+        finally:
+            METRICS.observe("sonoff_write_attributes", start)
+
+        METRICS.inc("sonoff_attributes_written", len(attributes))
+        return result
+
 
 (
     QuirkBuilder("SONOFF", "ZBMicro")